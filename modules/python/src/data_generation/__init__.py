@@ -1,6 +1,6 @@
 from .data_transformation_helpers import EntryTransformers, DataTransformationHelpers
 from .selectors_helpers import DictSelectorHelpers
-from .format_helpers import FormatHelpers
+from .format_helpers import FloatFormatter, FormatHelpers
 from .generators import Generators, SingleGenerators
 from .data_generation import (
     DataGenerator,
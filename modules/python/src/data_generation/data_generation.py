@@ -1,11 +1,32 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+import csv
 import logging
-import pandas as pd
+import numpy as np
 from pathlib import Path
+import sys
 from typing import Any, Callable, TypeAlias
 
 DEFAULT_N_SAMPLES: int = 1000
 
 
+def _write_csv(target: Path | None, data: dict[str, list]):
+    """
+    Writes series as csv columns, row by row, without building an intermediate dataframe.
+
+    :param target: file to write to, if None the standard output is used
+    :param data: series to write, by column name
+    :raises ValueError: if the series are not all of the same length, before anything is written
+    """
+    if len({len(series) for series in data.values()}) > 1:
+        raise ValueError("All series must be of the same length.")
+    output = nullcontext(sys.stdout) if target is None else open(target, mode="w", newline="\n", encoding="utf-8")
+    with output as stream:
+        writer = csv.writer(stream, lineterminator="\n")
+        writer.writerow(data.keys())
+        writer.writerows(zip(*data.values(), strict=True))
+
+
 class DataSeries:
     """
     Defines a series of values (csv column).
@@ -47,12 +68,15 @@ class DataSeries:
         self.kwargs = kwargs
         "Arguments for the generator."
 
-    def generate_data(self, nsamples: int) -> list:
-        "Generates N samples of data and formats it if necessary."
-        data = self.generator(nsamples, **self.kwargs)
+    def generate_data(self, nsamples: int) -> np.ndarray:
+        "Generates N samples of data as an array and formats it if necessary."
+        data = np.asarray(self.generator(nsamples, **self.kwargs))
         data_formatted = data
-        if self.formatter is not None:
-            data_formatted = [self.formatter(d) for d in data]
+        if hasattr(self.formatter, "vectorized"):
+            # Formats the whole series in one go
+            data_formatted = self.formatter.vectorized(data)
+        elif self.formatter is not None:
+            data_formatted = np.asarray([self.formatter(d) for d in data])
         return data_formatted
 
 
@@ -81,7 +105,7 @@ class DataGenerator:
         self.series = series
         self.output = output
         self.output_data_transformer = output_data_transformer
-        self.generated_data: dict[str, list] = {}
+        self.generated_data: dict[str, np.ndarray] = {}
         self.logger = logging.getLogger()
 
     def generate_series(self, nsamples: int):
@@ -97,6 +121,17 @@ class DataGenerator:
         self.generate_series(nsamples)
         self.export()
 
+    def run(self, nsamples: int, context: dict[str, Any]):
+        """
+        Generates the series as part of an overlord run, sharing the generated data with the next generators.
+        Exporting is left to the overlord.
+
+        :param nsamples: number of samples to generate
+        :param context: data shared between the generators of the run
+        """
+        self.generate_series(nsamples)
+        context["last_data"] = self.generated_data
+
     def export(self, output_file: Path | None = None):
         """
         Exports the series to the setup output file or a custom one, applying the data transformer before.
@@ -104,17 +139,13 @@ class DataGenerator:
         :param output_file: custom file to export the data to
         """
         target = self.output if output_file is None else output_file
-        self.logger.info(f"Writing to file: {target}")
+        self.logger.info("Writing to file: %s", target)
         data_transformed = (
             self.generated_data
             if self.output_data_transformer is None
             else self.output_data_transformer(self.generated_data)
         )
-        if target is not None:
-            pd.DataFrame(data_transformed).to_csv(path_or_buf=None, index=False)
-        else:
-            with open(target, mode="w", newline="\n") as datafile:
-                pd.DataFrame(data_transformed).to_csv(datafile, index=False, sep='\t', encoding='utf-8')
+        _write_csv(target, data_transformed)
 
 
 class StatisticsSeries:
@@ -196,6 +227,16 @@ class StatisticsGenerator:
         self.generate_statistics(data)
         self.export()
 
+    def run(self, nsamples: int, context: dict[str, Any]):
+        """
+        Generates the statistics as part of an overlord run, on the last generated data.
+        Exporting is left to the overlord.
+
+        :param nsamples: number of samples of the run, unused
+        :param context: data shared between the generators of the run
+        """
+        self.generate_statistics(context["last_data"])
+
     def export(self, output_file: Path | None = None):
         """
         Exports the statistics series to the setup output file or a custom one, applying the data transformer before.
@@ -203,15 +244,7 @@ class StatisticsGenerator:
         :param output_file: custom file to export the data to
         """
         target = self.output if output_file is None else output_file
-        header = ",".join([str(item) for item in self.generated_data.keys()])
-        data = ",".join([str(item) for item in self.generated_data.values()])
-        if target is None:
-            print(f"{header}\n")
-            print(f"{data}\n")
-        else:
-            with open(target, mode="w", newline="\n") as statsfile:
-                statsfile.write(f"{header}\n")
-                statsfile.write(f"{data}\n")
+        _write_csv(target, {name: [value] for name, value in self.generated_data.items()})
 
 
 Generator: TypeAlias = DataGenerator | StatisticsGenerator
@@ -234,21 +267,32 @@ class GeneratorOverlord:
         """
         Generate all series, attributing each target path in order to its list of generators.
         Each statistics generator will be fed the previous data generator's data.
+        Exports are written in order by a background thread while the next generators are running.
 
         :param targets: a list of path to files to feed to the generators that will be converted to a list of paths and fed to the generators.
         :param nsamples: amount of sample to generate for each data generator. Default is DEFAULT_N_SAMPLES.
         """
-        last_data_generator: DataGenerator | None = None
+        context: dict[str, Any] = {}
         if len(targets) != len(self.generators):
             self.logger.warning(
                 f"Amount of provided files ({len(targets)}) does not match the amount of generators ({len(self.generators)})."
             )
-        for generator, target in zip(self.generators, targets):
-            self.logger.info(f"{type(generator)} => {target}")
-            generator.output = Path(target).resolve()
-            if type(generator) is DataGenerator:
-                last_data_generator = generator
-                generator.generate_and_export(nsamples)
-            elif type(generator) is StatisticsGenerator:
-                generator.generate_and_export(last_data_generator.generated_data)
-            self.logger.info(f"File created: {generator.output}")
+        # Exports pending per generator, a single worker keeps them in order
+        exports: dict[int, Future] = {}
+        paths = [Path(target).resolve() for target in targets]
+        with ThreadPoolExecutor(max_workers=1) as io:
+            for generator, path in zip(self.generators, paths):
+                # A generator listed several times must be done exporting before being reused
+                if id(generator) in exports:
+                    exports.pop(id(generator)).result()
+                self.logger.info("%s => %s", type(generator), path)
+                generator.output = path
+                generator.run(nsamples, context)
+                exports[id(generator)] = io.submit(self.__export, generator)
+            for export in exports.values():
+                export.result()
+
+    def __export(self, generator: Generator):
+        "Exports a generator's data, from the export thread."
+        generator.export()
+        self.logger.info("File created: %s", generator.output)
@@ -1,7 +1,6 @@
 # This is an example on how to generate data and statistics using the data_generation module.
 # Usage: python -m data_generation file1.csv file2.csv
 
-import statistics
 import sys
 import numpy as np
 
@@ -30,11 +29,11 @@ def main() -> int:
 
     stats: StatisticsGenerator = StatisticsGenerator(
         [
-            StatisticsSeries("Minimum", DictSelectorHelpers.of_series(serie_x.name, min)),
-            StatisticsSeries("Maximum", DictSelectorHelpers.of_series(serie_x.name, max)),
+            StatisticsSeries("Minimum", DictSelectorHelpers.of_series(serie_x.name, np.min)),
+            StatisticsSeries("Maximum", DictSelectorHelpers.of_series(serie_x.name, np.max)),
             StatisticsSeries(
                 "Mean",
-                DictSelectorHelpers.of_series(serie_x.name, statistics.mean),
+                DictSelectorHelpers.of_series(serie_x.name, np.mean),
                 FormatHelpers.to_float(2),
             ),
             StatisticsSeries("MIN_TLA", lambda _: SingleGenerators.random_tla()),
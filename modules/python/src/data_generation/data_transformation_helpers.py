@@ -1,24 +1,52 @@
 from collections import Counter
+import numpy as np
 from typing import Any, Callable
 
+from .generators import _has_single_scalar_type
+
 
 class EntryTransformers:
 
     @staticmethod
-    def to_percentile(entries: list, value: int | float) -> float:
+    def to_percentile(entries: list, value: int | float | np.ndarray) -> float | np.ndarray:
         """
         Converts a value to a percentage of its value among the sum of all values in a list.
 
         :param entries: original list of entries
-        :param value: value to transform
-        :return: a percentage value
+        :param value: value to transform, or an array of values to transform all at once
+        :return: a percentage value, or an array of them
         """
-        return float(value) * 100 / len(entries)
+        return value * 100.0 / len(entries)
 
 
 class DataTransformationHelpers:
     "Contains methods to transform dictionary content and nature."
 
+    @staticmethod
+    def count_occurrences(entries: list) -> tuple[list, np.ndarray]:
+        """
+        Counts the occurrences of each distinct value of a series.
+
+        Numeric arrays and series of a single numeric type are counted with numpy in a single pass, other series
+        (mixed types, enums, ragged or non numeric entries) fall back on a `Counter` so that their values are kept as is.
+
+        :param entries: series to count the values of
+        :return: a tuple (values, counts), values being sorted and counts being an int64 array
+        """
+        values = entries if isinstance(entries, np.ndarray) else None
+        if values is None and _has_single_scalar_type(entries):
+            # Converting mixed types or subclasses would coerce them to a common one, e.g. ints to floats or enums to ints
+            try:
+                values = np.asarray(entries)
+            except (TypeError, ValueError):
+                values = None
+        if values is not None and values.ndim == 1 and values.dtype.kind in "biuf":
+            keys, counts = np.unique(values, return_counts=True)
+            return keys.tolist(), counts.astype(np.int64, copy=False)
+        counter = Counter(entries)
+        keys = sorted(counter)
+        return keys, np.fromiter((counter[k] for k in keys), dtype=np.int64, count=len(keys))
+
     @staticmethod
     def to_histogram(
         data: dict[str, list],
@@ -38,12 +66,16 @@ class DataTransformationHelpers:
         :param entry_transformer: an optional transformer to pass the generated values through, taking as input the original extracted list
         :return: a dataframe
         """
-        counter = Counter(data[sum_index])
-        result: dict[str, list] = {key_index: [], values_index: []}
-        for k, v in sorted(counter.items()):
-            result[key_index].append(k)
-            if entry_transformer is None:
-                result[values_index].append(v)
-            else:
-                result[values_index].append(entry_transformer(data[sum_index], v))
-        return result
+        entries = data[sum_index]
+        keys, counts = DataTransformationHelpers.count_occurrences(entries)
+        if counts.size == 0:
+            # Nothing to transform, which also spares transformers dividing by the amount of entries
+            values = []
+        elif entry_transformer is EntryTransformers.to_percentile:
+            # Well-known transformer, done in one go over all counts
+            values = entry_transformer(entries, counts).tolist()
+        elif entry_transformer is not None:
+            values = [entry_transformer(entries, v) for v in counts.tolist()]
+        else:
+            values = counts.tolist()
+        return {key_index: keys, values_index: values}
@@ -1,9 +1,46 @@
-from typing import Callable
+from functools import lru_cache
+import numpy as np
+
+
+class FloatFormatter:
+    """
+    Formatter rounding floats to a given precision, usable as a Callable on single values or on whole series at once.
+
+    Attributes
+    ----------
+    precision: int
+      Number of decimals to keep, read-only as formatters are shared between callers.
+    """
+
+    def __init__(self, precision: int):
+        self._precision = precision
+        "Number of decimals to keep."
+        self._format = f"%.{precision}f"
+        "Format string, built once rather than on every call."
+
+    @property
+    def precision(self) -> int:
+        "Number of decimals to keep."
+        return self._precision
+
+    def __call__(self, f: float) -> float:
+        return float(self._format % f)
+
+    def vectorized(self, data) -> np.ndarray:
+        """
+        Formats a whole series of values at once.
+
+        :param data: series of numeric values
+        :return: the rounded values
+        """
+        return np.round(np.asarray(data, dtype=np.float64), self._precision)
 
 
 class FormatHelpers:
     "Contains different formatters to be used as callables."
 
     @staticmethod
-    def to_float(precision: int) -> Callable[[float], float]:
-        return lambda f: float(f"%.{precision}f" % f)
+    @lru_cache(maxsize=32)
+    def to_float(precision: int) -> FloatFormatter:
+        "Gets the float formatter for a given precision, shared by all callers asking for that precision."
+        return FloatFormatter(precision)
@@ -1,20 +1,65 @@
+from functools import lru_cache
 import numpy as np
 import random
 import string
 
+_RNG = np.random.default_rng()
+"Random generator shared by the vectorized generators."
+VECTORIZED_STR_MIN_LENGTH: int = 64
+"Length from which random strings are drawn with numpy, under it `random.choices` is faster."
+
+
+@lru_cache(maxsize=32)
+def _ascii_letters(population: str) -> np.ndarray:
+    "Converts an ascii population to an array of character codes, once per population."
+    return np.frombuffer(population.encode("ascii"), dtype=np.uint8)
+
+
+_PLAIN_SCALAR_TYPES = (int, float, bool, str)
+"Builtin scalar types numpy stores without changing the values' type."
+
+
+def _has_single_scalar_type(values) -> bool:
+    """
+    Checks that all values are of the exact same plain scalar type, builtin or numpy.
+    Subclasses such as enums would be coerced to their base type by numpy.
+
+    :param values: values to check
+    :return: True if they can be converted to a typed array and back as is
+    """
+    types = {type(value) for value in values}
+    if len(types) != 1:
+        return False
+    value_type = types.pop()
+    return value_type in _PLAIN_SCALAR_TYPES or issubclass(value_type, np.generic)
+
+
+def _as_population(population) -> np.ndarray:
+    """
+    Converts a population to a 1-D array to sample from, without coercing its members to a common type.
+
+    :param population: population to convert
+    :return: a typed array if all members are plain scalars of the same type, an object array of the members otherwise
+    """
+    if isinstance(population, np.ndarray):
+        return population
+    if len(population) == 0 or _has_single_scalar_type(population):
+        return np.asarray(population)
+    return np.fromiter(population, dtype=object, count=len(population))
+
 
 class Generators:
     "Contains different data generator that can be used as Callables to generate multiple samples."
 
     @staticmethod
-    def index(nsamples: int, start: int = 0) -> list:
+    def index(nsamples: int, start: int = 0) -> np.ndarray:
         """
-        Generates a list of indexes.
+        Generates an array of indexes.
 
         :param nsamples: number of samples to generate.
         :param start: start of the index
         """
-        return list(range(start, nsamples))
+        return np.arange(start, nsamples, dtype=np.int64)
 
     @staticmethod
     def normal_distribution(
@@ -34,32 +79,32 @@ class Generators:
         :param max_mu_factor: multiplier for mu representing the biggest possible mu, only if mu is not specified.
         :return: list of n samples from the distribution
         """
-        rand = np.random.default_rng()
-        mu_real = random.uniform(-1,1) * max_mu_factor if mu is None else mu
-        sigma_real = rand.random() if sigma is None else sigma
-        generated = mu_real + sigma_real * rand.standard_normal(nsamples)
-        return generated
+        mu_real = _RNG.uniform(-max_mu_factor, max_mu_factor) if mu is None else mu
+        sigma_real = _RNG.random() if sigma is None else sigma
+        # The generator applies mu and sigma within the draw itself
+        return _RNG.normal(loc=mu_real, scale=sigma_real, size=nsamples)
     
     @staticmethod
-    def of(nsamples: int, population: list) -> list:
+    def of(nsamples: int, population: list) -> np.ndarray:
         """
         Generates random samples from a given population list.
 
         :param nsamples: number of samples to generate.
         :param population: population from which the samples will be taken.
-        :return: list of n samples from the population
+            Mixed types, enums or sequence members are sampled as they are, from an object array.
+        :return: array of n samples from the population
         """
-        return random.choices(population, k=nsamples)
+        return _RNG.choice(_as_population(population), size=nsamples)
 
     @staticmethod
-    def scalar(nsamples: int, value) -> list:
+    def scalar(nsamples: int, value) -> np.ndarray:
         """
         Generates the same value.
 
         :param nsamples: number of samples to generate.
         :param value: the value of each sample.
         """
-        return [value] * nsamples
+        return np.full(nsamples, value)
 
 class SingleGenerators:
     "Contains different data generator that can be used as Callables to generate a single value."
@@ -77,6 +122,9 @@ class SingleGenerators:
         real_length = length
         if random_length:
             real_length = random.randrange(1, length)
+        if real_length >= VECTORIZED_STR_MIN_LENGTH and isinstance(population, str) and population.isascii():
+            letters = _ascii_letters(population)
+            return letters[_RNG.integers(0, letters.size, size=real_length)].tobytes().decode("ascii")
         return "".join(random.choices(population, k=real_length))
 
     @staticmethod
@@ -87,3 +135,14 @@ class SingleGenerators:
         :return: one TLA
         """
         return SingleGenerators.random_str(3, string.ascii_uppercase)
+
+    @staticmethod
+    def random_tla_many(n: int) -> np.ndarray:
+        """
+        Generates many random TLAs (Three Letters Acronym) at once, without looping on each string.
+
+        :param n: number of TLAs to generate
+        :return: an array of n TLAs
+        """
+        codes = _RNG.integers(ord("A"), ord("Z") + 1, size=(n, 3), dtype=np.uint8)
+        return codes.view("S3").ravel().astype(str)
@@ -11,6 +11,18 @@ class Plot(ABC):
 
     def __init__(self, plot_cfg: PlotConfiguration | None = None):
         self.plot_cfg = plot_cfg if plot_cfg is not None else PlotConfiguration()
+        self.shared_scale = False
+        """
+        Whether the axes scales are shared with another subplot which already applied them, set by the layout.
+        In that case only labels and title are applied by this plot's configuration.
+        """
+
+    def prepare(self):
+        """
+        Prepares what the plot needs before being generated, e.g. loading its data. Does nothing by default.
+        The layout calls it for all its plots concurrently before generating them, so it should not draw anything.
+        """
+        pass
 
     @abstractmethod
     def generate(self, axis: Axes):
@@ -23,4 +35,4 @@ class Plot(ABC):
 
         :param axis: axes to generate the plot on
         """
-        self.plot_cfg.apply_to_axis(axis)
+        self.plot_cfg.apply_to_axis(axis, scale=not self.shared_scale)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import StrEnum
+from functools import lru_cache
 import numpy as np
 from matplotlib.axes import Axes
 from matplotlib.ticker import Formatter
@@ -30,6 +31,25 @@ AxisOrientation: TypeAlias = Literal[Orientation.X_AXIS, Orientation.Y_AXIS]
 "Usual orientation for axes, i.e. X/horizontal or Y/vertical. This is a subset of the Orientation enum."
 
 
+@lru_cache(maxsize=128)
+def _compute_ticks(
+    minimum: float, maximum: float, step: float, tick_formatter: Callable[[Any], str] | str | None
+) -> tuple[np.ndarray, tuple[str, ...] | None]:
+    """
+    Computes the ticks and their labels for a bins configuration, once for all axes sharing the same one.
+
+    :return: a tuple (ticks, labels), ticks being read-only
+    """
+    ticks = np.arange(minimum, maximum + 0.1, step)
+    ticks.flags.writeable = False
+    labels = None
+    if isinstance(tick_formatter, str):
+        labels = tuple(np.char.mod(tick_formatter, ticks).tolist())
+    elif tick_formatter is not None:
+        labels = tuple(tick_formatter(a) for a in ticks)
+    return ticks, labels
+
+
 @dataclass
 class PlotBins:
     """
@@ -43,8 +63,9 @@ class PlotBins:
       Maximum bins for the axis. Default is None.
     step: float | None
       Bins step for the axis. Default is None.
-    tick_formatter: Callable[[Any],str] | None
+    tick_formatter: Callable[[Any],str] | str | None
       Bin tick formatter for the axis, converting every step of the range to a string usable by matplotlib.
+      It can also be a printf-style format code (e.g. "%.2f"), which formats all ticks at once.
       Default is None, which will leave matplotlib format it automatically.
     """
 
@@ -54,9 +75,10 @@ class PlotBins:
     "Maximum bins for the axis."
     step: float | None = None
     "Bins step for the axis, one needs to specify a tick formatter to have text on the axis."
-    tick_formatter: Callable[[Any], str] | None = None
+    tick_formatter: Callable[[Any], str] | str | None = None
     """
     Bin tick formatter for the axis, converting every step of the range to a string usable by matplotlib.
+    It can also be a printf-style format code (e.g. "%.2f"), which formats all ticks at once.
     If left to None, matplotlib will format it automatically.
     """
 
@@ -116,15 +138,18 @@ class PlotAxisConfiguration:
         "Create a new axis configuration for the Y axis."
         return PlotAxisConfiguration(Orientation.Y_AXIS)
 
-    def apply_to_axis(self, axis: Axes):
+    def apply_to_axis(self, axis: Axes, scale: bool = True):
         """
         Applies its configuration to provided axis, if provided.
 
         :param axis: Axis to apply the configuration to
+        :param scale: whether to apply the scale (bins and formatters) too, which can be skipped if the axis shares it
+            with another one it has already been applied to. Default is True.
         """
         self._apply_text(axis)
-        self._apply_bins(axis)
-        self._apply_formatters(axis)
+        if scale:
+            self._apply_bins(axis)
+            self._apply_formatters(axis)
 
     def _apply_text(self, axis: Axes):
         "Applies label."
@@ -156,9 +181,14 @@ class PlotAxisConfiguration:
         ticks = None
         labels = None
         if self.bins.step is not None:
-            ticks = np.arange(self.bins.minimum, self.bins.maximum + 0.1, self.bins.step)
-            if self.bins.tick_formatter is not None:
-                labels = [self.bins.tick_formatter(a) for a in ticks]
+            bins = (self.bins.minimum, self.bins.maximum, self.bins.step, self.bins.tick_formatter)
+            compute = _compute_ticks
+            try:
+                hash(bins)
+            except TypeError:
+                # Unhashable tick formatter, cannot be cached
+                compute = _compute_ticks.__wrapped__
+            ticks, labels = compute(*bins)
         return ticks, labels
 
     def _apply_formatters(self, axis: Axes):
@@ -227,11 +257,12 @@ class PlotConfiguration:
     """
 
     def clone(self, **kwargs) -> PlotConfiguration:
-        "Produces a clone of itself in order to be reused with almost similar configuration."
-        target = PlotConfiguration()
-        target.__dict__.update(self.__dict__)
-        target.__dict__.update(kwargs)
-        return target
+        """
+        Produces a clone of itself in order to be reused with almost similar configuration.
+
+        :param kwargs: fields to override in the clone
+        """
+        return replace(self, **kwargs)
 
     def create_label(self, label: str) -> str:
         """
@@ -246,13 +277,14 @@ class PlotConfiguration:
         """
         return label if self.show_legend else LABEL_NO_LEGEND
 
-    def apply_to_axis(self, axes: Axes):
+    def apply_to_axis(self, axes: Axes, scale: bool = True):
         """
         Apply all possible configuration to a provided axes.
 
         :param axes: axes to apply the configuration to
+        :param scale: whether to apply the axes scales (bins and formatters) too. Default is True.
         """
-        self.x.apply_to_axis(axes)
-        self.y.apply_to_axis(axes)
+        self.x.apply_to_axis(axes, scale)
+        self.y.apply_to_axis(axes, scale)
         if self.title is not None:
             axes.set_title(self.title)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import math
 from matplotlib import pyplot as plt
 from matplotlib.figure import Figure
+import numpy as np
 from pathlib import Path
 from typing import Callable
 
@@ -14,6 +16,8 @@ DEFAULT_PLOT_WIDTH: float = 3.5
 "Default graphical width for one plot or each subplot, in inches."
 DEFAULT_PLOT_HEIGHT: float = 3.8
 "Default graphical height for one plot or each subplot, in inches."
+MAX_PREPARE_WORKERS: int = 8
+"Maximum number of threads preparing the plots of a layout at the same time."
 REASONABLE_SIZE_PER_LINE: int = 4
 """
 Reasonable minimum size (amount of plots) on the major layout axis before having to add a new line.
@@ -41,6 +45,9 @@ class LayoutExpansionPolicy:
       Provider for the minor axis size, usually related to the major axis size.
     title: str | None
       Title of the policy, strictly for debugging and tests purposes. Default is None.
+    major_size_lower_bound: Callable[[int],int] | None
+      Provider for a major axis size under which no grid can contain a given amount of plots, to skip straight to it.
+      Default is None, starting from the reasonable minimum major size.
     """
 
     reasonable_minimum_major_size: int
@@ -49,6 +56,8 @@ class LayoutExpansionPolicy:
     "Provider for the minor axis size, usually related to the major axis size."
     title: str | None = None
     "Title of the policy, strictly for debugging and tests purposes."
+    major_size_lower_bound: Callable[[int], int] | None = None
+    "Provider for a major axis size under which no grid can contain a given amount of plots, to skip straight to it."
 
     def __str__(self):
         return f"{self.title}"
@@ -67,7 +76,13 @@ class LayoutExpansionPolicy:
         :param subtrahend: amount subtracted from the current major size to determine the minor size
         :return: an expansion policy
         """
-        return LayoutExpansionPolicy(minimum, lambda n: max(1, n - subtrahend), title=f"M{minimum} & R-{subtrahend}")
+        return LayoutExpansionPolicy(
+            minimum,
+            lambda n: max(1, n - subtrahend),
+            title=f"M{minimum} & R-{subtrahend}",
+            # Positive root of M * (M - subtrahend) = N, or N itself while the minor size is 1
+            major_size_lower_bound=lambda n: min(n, (subtrahend + math.isqrt(subtrahend**2 + 4 * n)) // 2),
+        )
 
     @staticmethod
     def divided_ceil(minimum: int, divisor: int) -> LayoutExpansionPolicy:
@@ -80,7 +95,29 @@ class LayoutExpansionPolicy:
         :param divisor: divisor of the major size to calculate the minor size
         :return: an expansion policy
         """
-        return LayoutExpansionPolicy(minimum, lambda n: math.ceil(n / divisor), title=f"M{minimum} & R/{divisor}")
+        return LayoutExpansionPolicy(
+            minimum,
+            lambda n: math.ceil(n / divisor),
+            title=f"M{minimum} & R/{divisor}",
+            # Positive root of M * (M / divisor + 1) = N, which is above M * ceil(M / divisor)
+            major_size_lower_bound=lambda n: (math.isqrt(divisor**2 + 4 * n * divisor) - divisor) // 2,
+        )
+
+    def get_major_size(self, n_plots: int) -> int:
+        """
+        Calculates the major axis size for a given amount of plots, i.e. the smallest size from the reasonable minimum with
+        which the grid (major size x minor size) can contain all plots.
+
+        :param n_plots: amount of plots to fit
+        :return: the major axis size
+        """
+        n_major_size = self.reasonable_minimum_major_size
+        if self.major_size_lower_bound is not None:
+            n_major_size = max(n_major_size, self.major_size_lower_bound(n_plots))
+        # Check if the current major * calculated minor can contain all plots, if not increase major by one
+        while n_major_size * self.minor_size_provider(n_major_size) < n_plots:
+            n_major_size += 1
+        return n_major_size
 
 
 DEFAULT_EXPANSION_POLICY = LayoutExpansionPolicy.divided_ceil(REASONABLE_SIZE_PER_LINE, MAJOR_TO_MINOR_DIVISOR)
@@ -155,6 +192,8 @@ class PlotLayout:
     """
     Manages a plot with multiple subplots to display them in a layout. Use this class ONLY if you have a plot with subplots.
 
+    Subplots share their axes, so their scale (bins and formatters) is the one configured for the first subplot.
+
     Attributes
     ----------
     configuration : PlotLayoutConfiguration
@@ -230,12 +269,7 @@ class PlotLayout:
             n_major_size = len(self.plots)
             n_secondary_size = 1
         else:
-            # Start with the minimum
-            n_major_size = policy.reasonable_minimum_major_size
-            # Check if the current policy with the current major * calculated minor (acc. to policy) can contain all plots
-            while n_major_size * policy.minor_size_provider(n_major_size) < len(self.plots):
-                # If not increase major by one
-                n_major_size += 1
+            n_major_size = policy.get_major_size(len(self.plots))
             # Secondary is the rounded up amount of plots divided by the major size
             n_secondary_size = math.ceil(len(self.plots) / n_major_size)
         # Horizontal/X expands on the number of columns, not rows, and Vertical/Y vice-versa.
@@ -245,15 +279,30 @@ class PlotLayout:
             result = (n_major_size, n_secondary_size)
         return result
 
+    def prepare_plots(self):
+        """
+        Prepares all plots concurrently, so that loading their data overlaps before they are drawn one after the other.
+        """
+        if len(self.plots) <= 1:
+            for plot in self.plots:
+                plot.prepare()
+            return
+        with ThreadPoolExecutor(max_workers=min(len(self.plots), MAX_PREPARE_WORKERS)) as executor:
+            # Consumes the results to raise any preparation error
+            for _ in executor.map(lambda plot: plot.prepare(), self.plots):
+                pass
+
     def generate(self):
         """
-        Generates the plot and all its subplot.
+        Generates the plot and all its subplot, after preparing them.
 
         If the output path is `None`, will show the plot instead of saving it.
         """
+        self.prepare_plots()
         if len(self.plots) == 1:
             # Using the plot layout for only one plot is overkill but it works
             fig, ax = plt.subplots()
+            self.plots[0].shared_scale = False
             self.plots[0].generate(ax)
         else:
             nrows, ncols = self.get_grid()
@@ -262,15 +311,20 @@ class PlotLayout:
             fig, axs = plt.subplots(
                 nrows, ncols, sharex=True, sharey=True, figsize=(width, height)
             )
-            # Axes are a numpy ndarray with 2 dimensions: rows and columns, it needs to be flattened first just in case
-            # If there's only 1 row, flatten will return the same array
-            axes = axs.flatten()
-            for i, plot in enumerate(self.plots):
-                plot.generate(axes[i])
-            # Hide excess plots axes
-            excess = [i for i in range(len(self.plots), nrows*ncols)]
-            for i in excess:
-                axes[i].set_axis_off()
+            # Axes are usually a numpy ndarray with 2 dimensions: rows and columns, iterated over without copying them
+            # A 1x1 grid gives a single Axes instead of an array
+            axes = np.atleast_1d(axs).flat
+            for i, (plot, axis) in enumerate(zip(self.plots, axes)):
+                # Axes share their scales, only the first subplot applies them
+                plot.shared_scale = i > 0
+                try:
+                    plot.generate(axis)
+                finally:
+                    # Only holds within this layout, the plot may be drawn on its own or elsewhere afterwards
+                    plot.shared_scale = False
+            # Hide excess plots axes, i.e. the ones left over
+            for axis in axes:
+                axis.set_axis_off()
         self.configuration.apply_to_figure(fig)
         if self.output_path is not None:
             plt.savefig(self.output_path)
@@ -5,8 +5,14 @@ from __future__ import annotations
 
 import sys
 
+from functools import lru_cache
+from threading import Lock
+from typing import Any
+
+import numpy as np
 from matplotlib import ticker, pyplot as plt
 from matplotlib.axes import Axes
+from matplotlib.collections import PolyCollection
 from pathlib import Path
 from pandas import read_csv, DataFrame
 
@@ -17,6 +23,74 @@ from .plot_layout import PlotLayout, PlotLayoutConfiguration, Orientation, Layou
 DATA_PATH = Path("../data")
 ANNOTATION_ALIGN_LEFT = (0.05, 0.95)
 ANNOTATION_ALIGN_RIGHT = (0.55, 0.95)
+# Columns read from the csv files, typed upfront to skip pandas' type inference
+DATA_DTYPES = {'x': np.float64, 'entries': np.float64}
+STATS_DTYPES = {'Minimum': np.float64, 'Maximum': np.float64, 'Mean': np.float64, 'MIN_TLA': str, 'MAX_TLA': str, 'TLA': str}
+
+def _fast_bar(axis: Axes, x, heights, width: float, color, label: str | None = None) -> PolyCollection:
+  """
+  Draws bars as a single collection rather than one rectangle patch per bar.
+
+  :param axis: axis to draw on
+  :param x: centers of the bars
+  :param heights: heights of the bars
+  :param width: width of each bar
+  :param color: face color of the bars
+  :param label: label of the bars for the legend
+  :return: the created collection
+  """
+  x = np.asarray(x, dtype=np.float64)
+  heights = np.asarray(heights, dtype=np.float64)
+  left = x - width / 2
+  right = x + width / 2
+  zeros = np.zeros_like(x)
+  # One (left,0) (left,h) (right,h) (right,0) rectangle per bar
+  verts = np.stack([
+    np.stack([left, zeros], axis=-1),
+    np.stack([left, heights], axis=-1),
+    np.stack([right, heights], axis=-1),
+    np.stack([right, zeros], axis=-1),
+  ], axis=1)
+  bars = PolyCollection(verts, facecolors=color, label=label)
+  # Like axis.bar, keep the bars' base stuck to the axis
+  bars.sticky_edges.y.append(0)
+  axis.add_collection(bars)
+  axis.autoscale_view()
+  return bars
+
+_LOAD_LOCKS: dict[tuple[str, str], Lock] = {}
+"Lock per pair of files, so that plots prepared at the same time on the same files parse them only once."
+
+@lru_cache(maxsize=None)
+def _load_histo(data_csv: str, stats_csv: str) -> tuple[np.ndarray, np.ndarray, dict[str, Any]]:
+  """
+  Reads a histogram and its statistics, once per pair of files however many plots show them.
+
+  :param data_csv: path to the histogram csv file
+  :param stats_csv: path to the statistics csv file
+  :return: a tuple (x values, percentages of entries per x, statistics by name along with their annotation text)
+  """
+  # Data
+  datareader = read_csv(data_csv, usecols=DATA_DTYPES.keys(), dtype=DATA_DTYPES, engine='c', memory_map=True)
+  ax_data_x = datareader['x'].to_numpy()
+  ax_data_y_full = datareader['entries'].to_numpy()
+  # Make percentages: sum the numbers of entries and find the percentages for each x
+  total_samples = ax_data_y_full.sum()
+  ax_data_y_percent = ax_data_y_full * (100.0 / total_samples)
+  # Shared by all callers, so keep them from being modified
+  ax_data_x.setflags(write=False)
+  ax_data_y_percent.setflags(write=False)
+
+  # Statistics
+  statsreader: DataFrame = read_csv(stats_csv, usecols=STATS_DTYPES.keys(), dtype=STATS_DTYPES, nrows=1, engine='c')
+  stats = {name: statsreader.at[0, name] for name in STATS_DTYPES}
+  for name in ("Minimum", "Maximum", "Mean"):
+    stats[name] = float(stats[name])
+  stats["annotation"] = (
+    f"Min: {stats['Minimum']:.2f} at {stats['MIN_TLA']}\nMax: {stats['Maximum']:.2f} at {stats['MAX_TLA']}"
+    f"\nMean: {stats['Mean']}\nTLA: {stats['TLA']}"
+  )
+  return ax_data_x, ax_data_y_percent, stats
 
 class FakeHistogramPlot(Plot):
 
@@ -25,44 +99,36 @@ class FakeHistogramPlot(Plot):
     self.data_csv = data_csv
     self.stats_csv = stats_csv
 
+  def prepare(self):
+    files = (str(self.data_csv), str(self.stats_csv))
+    # The first plot on these files loads them, the others wait and get them from the cache
+    with _LOAD_LOCKS.setdefault(files, Lock()):
+      _load_histo(*files)
+
   def generate(self, axis: Axes):
     super().generate(axis)
-    total_samples = -1
-    y_extremum = 0
-
-    # Data
-    with open(self.data_csv, newline='') as datafile:
-      datareader = read_csv(datafile)
-      ax_data_x = datareader['x'].tolist()
-      ax_data_y_full = datareader['entries'].tolist()
-      # Make percentages: sum the numbers of entries and find the percentages for each x
-      total_samples = sum(ax_data_y_full)
-      ax_data_y_percent = [x * 100 / total_samples for x in ax_data_y_full]
-      y_extremum = max(ax_data_y_percent)
-      axis.bar(ax_data_x, ax_data_y_percent, width=self.plot_cfg.bar_width, color=self.plot_cfg.bar_colors[0], label=self.plot_cfg.create_label("FOO"))
+    ax_data_x, ax_data_y_percent, stats = _load_histo(str(self.data_csv), str(self.stats_csv))
+    y_extremum = ax_data_y_percent.max()
+    _fast_bar(axis, ax_data_x, ax_data_y_percent, self.plot_cfg.line_width, self.plot_cfg.colors[0], self.plot_cfg.create_label("FOO"))
 
     # Statistics
-    with open(self.stats_csv, newline='') as statsfile:
-      statsreader: DataFrame = read_csv(statsfile)
-      minimum = float(statsreader["Minimum"].to_list()[0])
-      maximum = float(statsreader["Maximum"].to_list()[0])
-      mean = float(statsreader["Mean"].to_list()[0])
-      minimum_tla = str(statsreader["MIN_TLA"].to_list()[0])
-      maximum_tla = str(statsreader["MAX_TLA"].to_list()[0])
-      other_tla = str(statsreader["TLA"].to_list()[0])
-      stats_x = [minimum, mean, maximum]
-      stats_y = [y_extremum / 4, y_extremum / 2, y_extremum / 4]
-      axis.bar(stats_x, stats_y, width=self.plot_cfg.bar_width, color=self.plot_cfg.bar_colors[1], label=self.plot_cfg.create_label("Bar"))
-      # Annotate
-      annotation_text = f"Min: {"%.2f" % minimum} at {minimum_tla}\nMax: {"%.2f" % maximum} at {maximum_tla}\nMean: {mean}\nTLA: {other_tla}"
-      annotation_coords = ANNOTATION_ALIGN_LEFT if self.plot_cfg.x.bins.maximum is not None and mean >= self.plot_cfg.x.bins.maximum / 2 else ANNOTATION_ALIGN_RIGHT
-      axis.annotate(annotation_text, annotation_coords, xycoords="axes fraction", fontsize="small", linespacing=1.5, va="top")
+    minimum = stats["Minimum"]
+    maximum = stats["Maximum"]
+    mean = stats["Mean"]
+    stats_x = [minimum, mean, maximum]
+    stats_y = [y_extremum / 4, y_extremum / 2, y_extremum / 4]
+    _fast_bar(axis, stats_x, stats_y, self.plot_cfg.line_width, self.plot_cfg.colors[1], self.plot_cfg.create_label("Bar"))
+    # Annotate
+    annotation_coords = ANNOTATION_ALIGN_LEFT if self.plot_cfg.x.bins.maximum is not None and mean >= self.plot_cfg.x.bins.maximum / 2 else ANNOTATION_ALIGN_RIGHT
+    axis.annotate(stats["annotation"], annotation_coords, xycoords="axes fraction", fontsize="small", linespacing=1.5, va="top")
 
 # Uncomment and change some lines if you want to play around
 def main() -> int:
   output_path = None
   if len(sys.argv) >= 2:
     output_path = Path(sys.argv[1])
+    # Only saving to a file, no need for an interactive backend and its GUI toolkit
+    plt.switch_backend("agg")
   layout_cfg = PlotLayoutConfiguration()
   layout_cfg.title = "Example of Plot Layout"
   layout_cfg.axis_labels = ("Common X values", "relative frequency per bin")
@@ -73,8 +139,8 @@ def main() -> int:
   plot_cfg = PlotConfiguration()
   plot_cfg.y.major_formatter = ticker.PercentFormatter(xmax=100)
   plot_cfg.x.bins = PlotBins(0.0, 5.0)
-  plot_cfg.bar_colors = ['tab:blue', 'orangered']
-  plot_cfg.bar_width = 0.05
+  plot_cfg.colors = ['tab:blue', 'orangered']
+  plot_cfg.line_width = 0.05
 
   layout.plots = [
     FakeHistogramPlot(DATA_PATH / "histo1_data.csv", DATA_PATH / "histo1_statistics.csv"),
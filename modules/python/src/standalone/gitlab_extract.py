@@ -5,11 +5,14 @@
 # Run this script with --help for full help.
 # Python dependencies to install (pip install <dependency>):
 # - requests
+# Optional dependencies, used if installed:
+# - orjson (faster JSON parsing and writing)
 
 import argparse
 import csv
 from dataclasses import dataclass
 from enum import StrEnum
+from functools import cached_property
 import json
 import logging
 from pathlib import Path
@@ -17,6 +20,42 @@ from requests import Response
 import requests
 import sys
 from typing import Any
+from urllib.parse import urlencode
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_SESSION = requests.Session()
+"HTTP session shared by the requests to Gitlab, reusing their connections."
+
+
+def _loads(content: bytes) -> Any:
+    """
+    Parses JSON content, with orjson if it is installed.
+
+    :param content: raw JSON content.
+    :return: the parsed data.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _dump(data: Any, output: Path):
+    """
+    Writes data as JSON to a file, with orjson if it is installed.
+
+    :param data: data to write.
+    :param output: path to the output file.
+    """
+    if orjson is not None:
+        with open(output, "wb") as target:
+            target.write(orjson.dumps(data))
+    else:
+        with open(output, "w") as target:
+            json.dump(data, target)
 
 
 class ArgParser:
@@ -62,17 +101,25 @@ class GitlabAuthentifier:
     token: str | None = None
     "Gitlab token or path to a file containing it."
 
+    @cached_property
+    def resolved_token(self) -> str | None:
+        """
+        Token to be used, either read from the file holding it or the token itself.
+        The file is only read on first access.
+        """
+        token = self.token
+        if token is not None and Path(token).exists():
+            with open(Path(token), "r", encoding="utf-8", newline="\n") as file:
+                token = file.readline().strip('\n')
+        return token
+
     def get_token(self) -> str | None:
         """
         Gets the token to be used by either reading a file with the token or the output the token itself.
 
         :return: the gitlab token
         """
-        token = self.token
-        if Path(token).exists():
-            with open(Path(self.token), "r", encoding="utf-8", newline="\n") as file:
-                token = file.readline().strip('\n')
-        return token
+        return self.resolved_token
 
 
 class GitlabIssuesImporter:
@@ -113,14 +160,12 @@ class GitlabIssuesImporter:
             "Content-Type": "application/x-www-form-urlencoded",
         }
 
-        if self.auth.token is not None:
-            headers["PRIVATE-TOKEN"] = f"{self.auth.get_token()}"
+        if self.auth is not None and self.auth.resolved_token is not None:
+            headers["PRIVATE-TOKEN"] = f"{self.auth.resolved_token}"
 
-        data = ["scope=all"]
-        data += [f"iids[]={id}" for id in self.issue_ids]
-        data = "&".join(data)
+        data = urlencode([("scope", "all"), *(("iids[]", id) for id in self.issue_ids)])
 
-        response = requests.get(f"{self.url}/projects/{self.project}/issues", headers=headers, data=data, verify=False)
+        response = _SESSION.get(f"{self.url}/projects/{self.project}/issues", headers=headers, data=data, verify=False)
         if response.status_code != requests.codes.ok:
             response.raise_for_status()
         return response
@@ -162,20 +207,23 @@ class CSVExporter(DataExporter):
     def __init__(self):
         self.fields: list[str] | None = None
         "JSON fields to get the value from for each item."
+        self._paths: list[tuple[str, ...]] = []
+        "Keys path of each field, split once rather than for each item."
         self._log = logging.getLogger(self.__class__.__name__)
         "Class logger."
 
     def configure_exporter(self, **kwargs):
         if "fields" in kwargs:
             self.fields = kwargs.get("fields").split(",")
+            self._paths = [tuple(field.split(".")) for field in self.fields]
 
     def export(self, output: Path, data: Response):
         with open(output, "w", newline='') as target:
             writer = csv.writer(target)
             writer.writerow(self.fields)
-            for item in data.json():
-                row = [self.get_value_from_key(field, item) for field in self.fields]
-                writer.writerow(row)
+            writer.writerows(
+                [self.get_value_from_path(path, item) for path in self._paths] for item in _loads(data.content)
+            )
 
     def get_value_from_key(self, key:str, json_data) -> Any:
         """
@@ -201,11 +249,22 @@ class CSVExporter(DataExporter):
         :param json_data: the json data to find the value in.
         :return: the value of the series of keys, None if it could not be found.
         """
-        keys = key.split(".")
-        it = iter(keys)
+        return self.get_value_from_path(tuple(key.split(".")), json_data)
+
+    @staticmethod
+    def get_value_from_path(path: tuple[str, ...], json_data) -> Any:
+        """
+        Gets a value from json data based on an already split nested key, see `get_value_from_key`.
+
+        :param path: the series of keys to the desired value.
+        :param json_data: the json data to find the value in.
+        :return: the value of the series of keys, None if it could not be found.
+        """
         item = json_data
-        while (x := next(it, None)) is not None and item is not None:
-            item = item.get(x, None)
+        for key in path:
+            if item is None:
+                break
+            item = item.get(key, None)
         return item
 
 
@@ -213,8 +272,7 @@ class JSONExporter(DataExporter):
     "Exporter for JSON format."
 
     def export(self, output: Path, data: Response):
-        with open(output, "w") as target:
-            json.dump(data.json(), target)
+        _dump(_loads(data.content), output)
 
 
 class ExporterFactory():
@@ -0,0 +1,24 @@
+import pytest
+
+from data_generation.data_generation import DataGenerator, DataSeries
+from data_generation.generators import Generators
+
+
+def test_data_generator__export(tmp_path):
+  output = tmp_path / "data.csv"
+  generator = DataGenerator([
+    DataSeries("i", Generators.index),
+    DataSeries("v", Generators.scalar, value=7),
+  ], output=output)
+  generator.generate_and_export(3)
+  assert output.read_text(encoding="utf-8") == "i,v\n0,7\n1,7\n2,7\n"
+
+
+def test_data_generator__export_series_of_different_lengths(tmp_path):
+  generator = DataGenerator([
+    DataSeries("i", Generators.index, start=2),
+    DataSeries("v", Generators.scalar, value=7),
+  ], output=tmp_path / "data.csv")
+  with pytest.raises(ValueError):
+    generator.generate_and_export(5)
+  assert not (tmp_path / "data.csv").exists()
@@ -0,0 +1,62 @@
+from enum import IntEnum
+import numpy as np
+import pytest
+
+from data_generation.data_transformation_helpers import DataTransformationHelpers, EntryTransformers
+
+
+class _Level(IntEnum):
+  LOW = 1
+  HIGH = 2
+
+
+@pytest.mark.parametrize(
+    "entries,expected_keys,expected_counts",
+    [
+      ([3, 1, 2, 1, 3, 3], [1, 2, 3], [2, 1, 3]),
+      (np.array([0.5, -1.25, 0.5]), [-1.25, 0.5], [1, 2]),
+      (["b", "a", "b"], ["a", "b"], [1, 2]),
+      ([], [], []),
+      ([1, 2.5, 1], [1, 2.5], [2, 1]),
+      ([(1, 2), (1, 2, 3), (1, 2)], [(1, 2), (1, 2, 3)], [2, 1]),
+      ([_Level.LOW, _Level.HIGH, _Level.LOW], [_Level.LOW, _Level.HIGH], [2, 1]),
+    ]
+)
+def test_to_histogram(entries, expected_keys, expected_counts):
+  result = DataTransformationHelpers.to_histogram({"x": entries}, "x", "x", "entries")
+  assert result == {"x": expected_keys, "entries": expected_counts}
+  assert [type(k) for k in result["x"]] == [type(k) for k in expected_keys]
+
+
+@pytest.mark.parametrize(
+    "entry_transformer",
+    [
+      EntryTransformers.to_percentile,
+      lambda entries, v: EntryTransformers.to_percentile(entries, v),
+    ]
+)
+def test_to_histogram__with_transformer(entry_transformer):
+  result = DataTransformationHelpers.to_histogram({"x": [1, 2, 2, 4]}, "x", "x", "entries", entry_transformer)
+  assert result["x"] == [1, 2, 4]
+  assert result["entries"] == pytest.approx([25.0, 50.0, 25.0])
+
+
+@pytest.mark.parametrize(
+    "entry_transformer",
+    [
+      EntryTransformers.to_percentile,
+      lambda entries, v: EntryTransformers.to_percentile(entries, v),
+    ]
+)
+def test_to_histogram__empty_with_transformer(entry_transformer):
+  result = DataTransformationHelpers.to_histogram({"x": []}, "x", "x", "entries", entry_transformer)
+  assert result == {"x": [], "entries": []}
+
+
+def test_to_percentile__same_values_for_scalars_and_arrays():
+  entries = [0] * 1000
+  counts = np.arange(200)
+  expected = [float(c) * 100 / len(entries) for c in range(200)]
+  assert EntryTransformers.to_percentile(entries, counts).tolist() == expected
+  assert [EntryTransformers.to_percentile(entries, c) for c in range(200)] == expected
+  assert EntryTransformers.to_percentile(entries, 3) == 0.3
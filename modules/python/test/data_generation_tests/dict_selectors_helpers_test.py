@@ -4,7 +4,7 @@ from pandas import DataFrame
 from data_generation.selectors_helpers import DictSelectorHelpers
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def dataseries() -> DataFrame:
   return DataFrame(data = {
     'x': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
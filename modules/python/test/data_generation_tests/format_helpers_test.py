@@ -0,0 +1,25 @@
+import pytest
+
+from data_generation.format_helpers import FormatHelpers
+
+
+@pytest.mark.parametrize(
+    "precision,value,expected",
+    [
+      (2, 1.2345, 1.23),
+      (0, 2.71828, 3.0),
+      (3, -0.00049, -0.0),
+    ]
+)
+def test_to_float(precision, value, expected):
+  formatter = FormatHelpers.to_float(precision)
+  assert formatter(value) == expected
+  assert formatter.vectorized([value]).tolist() == [expected]
+
+
+def test_to_float__precision_is_read_only():
+  formatter = FormatHelpers.to_float(2)
+  with pytest.raises(AttributeError):
+    formatter.precision = 3
+  assert formatter.precision == 2
+  assert FormatHelpers.to_float(2)(1.2345) == 1.23
@@ -1,5 +1,6 @@
+from enum import IntEnum, StrEnum
 import math
-from pandas import pandas as pd, Series
+import numpy as np
 import pytest
 import string
 
@@ -10,6 +11,16 @@ TOLERANCE=0.05
 "Tolerance for tests."
 
 
+class _Level(IntEnum):
+  LOW = 1
+  HIGH = 2
+
+
+class _Label(StrEnum):
+  X = "x"
+  Y = "y"
+
+
 def __check_with_tolerance(a, b) -> bool:
   return math.isclose(a, b, rel_tol=TOLERANCE)
 
@@ -27,16 +38,55 @@ def __check_with_tolerance(a, b) -> bool:
 )
 def test_generators__normal_distribution(nsamples, mu, max_mu_factor):
   generated = Generators.normal_distribution(nsamples, mu, max_mu_factor=max_mu_factor)
-  series =  pd.Series(generated)
+  samples = np.asarray(generated)
+  mean = samples.mean()
   if mu is None and max_mu_factor is not None:
-    assert series.mean() <= max_mu_factor
-    assert series.mean() >= -max_mu_factor
+    assert mean <= max_mu_factor
+    assert mean >= -max_mu_factor
   elif mu is None:
-    assert series.mean() <= 1.0
-    assert series.mean() >= -1.0
+    assert mean <= 1.0
+    assert mean >= -1.0
   else:
-    assert __check_with_tolerance(series.mean(), mu), f"Provided mu ({mu}) should be close to the series' mean ({series.mean()})"
+    assert __check_with_tolerance(mean, mu), f"Provided mu ({mu}) should be close to the series' mean ({mean})"
+  assert samples.size == nsamples
+
+
+@pytest.mark.parametrize(
+    "nsamples,start",
+    [
+      (10, 0),
+      (10, 4),
+      (0, 0),
+    ]
+)
+def test_generators__index(nsamples, start):
+  assert Generators.index(nsamples, start).tolist() == list(range(start, nsamples))
+
+
+@pytest.mark.parametrize(
+    "nsamples,population",
+    [
+      (100, [1, 2, 3]),
+      (100, ["a", "b"]),
+      (1, [0.5]),
+      (100, [1, "a"]),
+      (100, [1, 2.5]),
+      (100, [(1, 2), (3, 4)]),
+      (100, list(_Level)),
+      (100, list(_Label)),
+    ]
+)
+def test_generators__of(nsamples, population):
+  generated = Generators.of(nsamples, population)
   assert len(generated) == nsamples
+  assert set(generated.tolist()) <= set(population)
+  # Members are kept with their original type
+  assert {(type(s), s) for s in generated.tolist()} <= {(type(p), p) for p in population}
+
+
+@pytest.mark.parametrize("nsamples,value", [(5, 3), (5, "foo"), (0, 1.5)])
+def test_generators__scalar(nsamples, value):
+  assert Generators.scalar(nsamples, value).tolist() == [value] * nsamples
 
 
 @pytest.mark.parametrize(
@@ -47,6 +97,9 @@ def test_generators__normal_distribution(nsamples, mu, max_mu_factor):
       (10, string.printable, True),
       (3, string.ascii_letters, True),
       (8, string.digits, True),
+      (200, string.ascii_uppercase, False),
+      (200, list(string.digits), False),
+      (500, string.printable, True),
     ]
 )
 def test_single_generators__random_str(length, population, random_length):
@@ -56,3 +109,12 @@ def test_single_generators__random_str(length, population, random_length):
     assert len(result) <= length
   else:
     assert len(result) == length
+
+
+@pytest.mark.parametrize("n", [0, 1, 50])
+def test_single_generators__random_tla_many(n):
+  result = SingleGenerators.random_tla_many(n)
+  assert len(result) == n
+  for tla in result:
+    assert len(tla) == 3
+    assert set(tla) <= set(string.ascii_uppercase)
@@ -0,0 +1,12 @@
+import pytest
+
+from plot_layout import Plot
+
+
+@pytest.fixture(scope="session", autouse=True)
+def concrete_plot():
+    "Allows instantiating the abstract Plot for the whole session, restoring it afterwards."
+    abstract_methods = Plot.__abstractmethods__
+    Plot.__abstractmethods__ = frozenset()
+    yield
+    Plot.__abstractmethods__ = abstract_methods
@@ -0,0 +1,35 @@
+import pytest
+from matplotlib.figure import Figure
+
+from plot_layout import PlotAxisConfiguration, PlotBins, PlotConfiguration
+
+
+@pytest.mark.parametrize(
+    "axis_cfg",
+    [
+        PlotAxisConfiguration.for_x(),
+        PlotAxisConfiguration.for_y(),
+    ],
+)
+@pytest.mark.parametrize(
+    "tick_formatter",
+    [
+        "%.1f",
+        lambda t: f"{t:.1f}",
+    ],
+)
+def test_apply_to_axis__tick_formatter(axis_cfg: PlotAxisConfiguration, tick_formatter):
+    axis_cfg.bins = PlotBins(0.0, 1.0, 0.5, tick_formatter)
+    axes = Figure().add_subplot()
+    axis_cfg.apply_to_axis(axes)
+    labels = axes.get_xticklabels() if axis_cfg.orientation == "x" else axes.get_yticklabels()
+    assert [label.get_text() for label in labels] == ["0.0", "0.5", "1.0"]
+
+
+def test_clone():
+    cfg = PlotConfiguration(colors=["red"], title="Original")
+    clone = cfg.clone(title="Clone", show_legend=False)
+    assert clone is not cfg
+    assert (clone.colors, clone.title, clone.show_legend) == (["red"], "Clone", False)
+    assert (cfg.title, cfg.show_legend) == ("Original", True)
+    assert clone.x is cfg.x and clone.y is cfg.y
@@ -0,0 +1,25 @@
+import pytest
+
+from plot_layout.plot_layout_example import _load_histo
+
+STATS_CSV = "Minimum,Maximum,Mean,MIN_TLA,MAX_TLA,TLA\n-0.48,0.52,0.01,ABC,DEF,0.14\n"
+
+
+@pytest.mark.parametrize(
+    "entries",
+    [
+        ["1", "3"],  # Counts of entries
+        ["0.1", "0.3"],  # Percentages, as generated by the data_generation example
+    ],
+)
+def test_load_histo(tmp_path, entries: list[str]):
+    data_csv = tmp_path / "histo_data.csv"
+    stats_csv = tmp_path / "histo_stats.csv"
+    data_csv.write_text("x,entries\n" + "".join(f"{x},{e}\n" for x, e in zip(["-0.48", "0.52"], entries)))
+    stats_csv.write_text(STATS_CSV)
+    x, percents, stats = _load_histo(str(data_csv), str(stats_csv))
+    assert x.tolist() == [-0.48, 0.52]
+    assert percents.tolist() == pytest.approx([25.0, 75.0])
+    assert stats["Minimum"] == -0.48
+    assert stats["MIN_TLA"] == "ABC"
+    assert stats["TLA"] == "0.14"
@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+
 import pytest
 
 from plot_layout import (
@@ -8,14 +10,31 @@ from plot_layout import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def plot():
-    Plot.__abstractmethods__ = set()
     return Plot()
 
 
+class _RepeatedPlots(Sequence):
+    "The same plot repeated n times, without building a list of n references since grid tests only need the count."
+
+    def __init__(self, plot: Plot, n_plots: int):
+        self.plot = plot
+        self.n_plots = n_plots
+
+    def __len__(self) -> int:
+        return self.n_plots
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.plot] * len(range(*index.indices(self.n_plots)))
+        if not -self.n_plots <= index < self.n_plots:
+            raise IndexError(index)
+        return self.plot
+
+
 def test_get_grid__specified_grid_is_too_small(plot):
-    layout = PlotLayout([plot] * 15)
+    layout = PlotLayout(_RepeatedPlots(plot, 15))
     layout.configuration.grid = (2, 2)
     with pytest.raises(ValueError):
         layout.get_grid()
@@ -49,8 +68,7 @@ def test_get_grid__specified_grid_is_too_small(plot):
 def test_get_grid__default_policy(
     plot, orientation: Orientation | None, n_plots: int, expected_rows: int, expected_cols: int
 ):
-    list_of_plots: list[Plot] = [plot] * n_plots
-    layout = PlotLayout(list_of_plots)
+    layout = PlotLayout(_RepeatedPlots(plot, n_plots))
     if orientation is not None:
         layout.configuration.orientation = orientation
     grid = layout.get_grid()
@@ -79,8 +97,7 @@ def test_get_grid__custom_policy(
     expected_rows: int,
     expected_cols: int,
 ):
-    list_of_plots: list[Plot] = [plot] * n_plots
-    layout = PlotLayout(list_of_plots)
+    layout = PlotLayout(_RepeatedPlots(plot, n_plots))
     layout.configuration.expansion_policy = policy
     if orientation is not None:
         layout.configuration.orientation = orientation
@@ -105,11 +122,61 @@ def test_get_grid__with_override(
     """
     This test verifies that the grid override attribute actually overrides the auto layouting.
     """
-    list_of_plots: list[Plot] = [plot] * n_plots
-    layout = PlotLayout(list_of_plots)
+    layout = PlotLayout(_RepeatedPlots(plot, n_plots))
     if provided_grid is not None:
         layout.configuration.grid = provided_grid
     if orientation is not None:
         layout.configuration.orientation = orientation
     grid = layout.get_grid()
     assert grid == provided_grid
+
+
+@pytest.mark.parametrize(
+    "policy",
+    [
+        LayoutExpansionPolicy.minus(1, 3),
+        LayoutExpansionPolicy.minus(5, 1),
+        LayoutExpansionPolicy.minus(4, 0),
+        LayoutExpansionPolicy.divided_ceil(4, 2),
+        LayoutExpansionPolicy.divided_ceil(3, 3),
+        LayoutExpansionPolicy.divided_ceil(1, 7),
+    ],
+)
+def test_get_major_size__lower_bound_matches_search(policy: LayoutExpansionPolicy):
+    """
+    This test verifies that skipping to the policy's lower bound gives the same major size as searching from the minimum.
+    """
+    for n_plots in range(1, 500):
+        expected = policy.reasonable_minimum_major_size
+        while expected * policy.minor_size_provider(expected) < n_plots:
+            expected += 1
+        assert policy.get_major_size(n_plots) == expected, f"{n_plots} plots"
+
+
+@pytest.mark.parametrize("n_plots", [0, 1, 12])
+def test_prepare_plots(n_plots: int):
+    prepared = []
+
+    class PreparedPlot(Plot):
+        def prepare(self):
+            prepared.append(self)
+
+        def generate(self, axis):
+            pass
+
+    plots = [PreparedPlot() for _ in range(n_plots)]
+    PlotLayout(plots).prepare_plots()
+    assert sorted(map(id, prepared)) == sorted(map(id, plots))
+
+
+def test_generate__shared_scale_reset(tmp_path):
+    shared_scales = []
+
+    class RecordingPlot(Plot):
+        def generate(self, axis):
+            shared_scales.append(self.shared_scale)
+
+    plots = [RecordingPlot() for _ in range(3)]
+    PlotLayout(plots, output_path=tmp_path / "layout.png").generate()
+    assert shared_scales == [False, True, True]
+    assert [plot.shared_scale for plot in plots] == [False, False, False]